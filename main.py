@@ -4,15 +4,19 @@ import json
 import os
 import random
 import re
+import sys
 import time
 import webbrowser
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, List, Set, Tuple, Optional, Union
 
 import pytz
 import requests
 import yaml
+from requests.adapters import HTTPAdapter, Retry
 
 
 VERSION = "2.2.0"
@@ -128,11 +132,25 @@ CONFIG = load_config()
 print(f"TrendRadar v{VERSION} 配置加载完成")
 print(f"监控平台数量: {len(CONFIG['PLATFORMS'])}")
 
+# 全局复用的 HTTP 会话，保持长连接，避免每次请求重新握手
+# 仅对建立连接阶段的失败做退避重试，请求已发出后不重试，避免 webhook 重复推送
+HTTP_SESSION = requests.Session()
+HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.5),
+)
+HTTP_SESSION.mount("http://", HTTP_ADAPTER)
+HTTP_SESSION.mount("https://", HTTP_ADAPTER)
+
 
 # === 工具函数 ===
+BEIJING_TZ = pytz.timezone("Asia/Shanghai")
+
+
 def get_beijing_time():
     """获取北京时间"""
-    return datetime.now(pytz.timezone("Asia/Shanghai"))
+    return datetime.now(BEIJING_TZ)
 
 
 def format_date_folder():
@@ -145,12 +163,19 @@ def format_time_filename():
     return get_beijing_time().strftime("%H时%M分")
 
 
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
 def clean_title(title: str) -> str:
-    """清理标题中的特殊字符"""
+    """清理标题中的特殊字符，同一标题会在多个推送渠道中重复处理，结果做缓存"""
     if not isinstance(title, str):
         title = str(title)
-    cleaned_title = title.replace("\n", " ").replace("\r", " ")
-    cleaned_title = re.sub(r"\s+", " ", cleaned_title)
+    # 大部分标题不含连续空白或特殊空白字符，可直接跳过正则替换
+    if "  " not in title and title.isprintable():
+        return title.strip()
+    # \s 已覆盖换行和回车，一次替换即可完成清理
+    cleaned_title = WHITESPACE_PATTERN.sub(" ", title)
     cleaned_title = cleaned_title.strip()
     return cleaned_title
 
@@ -183,7 +208,7 @@ def check_version_update(
             "Cache-Control": "no-cache",
         }
 
-        response = requests.get(
+        response = HTTP_SESSION.get(
             version_url, proxies=proxies, headers=headers, timeout=10
         )
         response.raise_for_status()
@@ -212,6 +237,18 @@ def check_version_update(
         return False, None
 
 
+def list_txt_files(txt_dir: Path) -> List[Path]:
+    """按文件名顺序列出目录下的txt文件，scandir 自带文件类型信息，无需逐个 stat"""
+    with os.scandir(txt_dir) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".txt") and entry.is_file()
+        ]
+    names.sort()
+    return [txt_dir / name for name in names]
+
+
 def is_first_crawl_today() -> bool:
     """检测是否是当天第一次爬取"""
     date_folder = format_date_folder()
@@ -220,12 +257,25 @@ def is_first_crawl_today() -> bool:
     if not txt_dir.exists():
         return True
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
+    files = list_txt_files(txt_dir)
     return len(files) <= 1
 
 
+def utf8_len(text: str) -> int:
+    """计算字符串的 UTF-8 字节长度，纯 ASCII 时无需编码"""
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-8"))
+
+
+def encode_json_payload(payload: Dict) -> bytes:
+    """序列化推送消息体，中文直接输出 UTF-8 而不转义为 \\uXXXX，体积更小"""
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+@lru_cache(maxsize=4096)
 def html_escape(text: str) -> str:
-    """HTML转义"""
+    """HTML转义，来源名称等字段大量重复，结果做缓存"""
     if not isinstance(text, str):
         text = str(text)
 
@@ -242,32 +292,45 @@ def html_escape(text: str) -> str:
 class PushRecordManager:
     """推送记录管理器"""
 
+    # 过期记录按天清理，同一进程内每天只需清理一次
+    last_cleanup_date: Optional[str] = None
+
     def __init__(self):
         self.record_dir = Path("output") / ".push_records"
         self.ensure_record_dir()
-        self.cleanup_old_records()
+
+        now = get_beijing_time()
+        today = now.strftime("%Y%m%d")
+        if PushRecordManager.last_cleanup_date != today:
+            self.cleanup_old_records(now)
+            PushRecordManager.last_cleanup_date = today
 
     def ensure_record_dir(self):
         """确保记录目录存在"""
         self.record_dir.mkdir(parents=True, exist_ok=True)
 
-    def get_today_record_file(self) -> Path:
-        """获取今天的记录文件路径"""
-        today = get_beijing_time().strftime("%Y%m%d")
+    def get_today_record_file(self, now: Optional[datetime] = None) -> Path:
+        """获取今天的记录文件路径，可传入已获取的当前时间"""
+        if now is None:
+            now = get_beijing_time()
+        today = now.strftime("%Y%m%d")
         return self.record_dir / f"push_record_{today}.json"
 
-    def cleanup_old_records(self):
+    def cleanup_old_records(self, now: Optional[datetime] = None):
         """清理过期的推送记录"""
+        if now is None:
+            now = get_beijing_time()
         retention_days = CONFIG["SILENT_PUSH"]["RECORD_RETENTION_DAYS"]
-        current_time = get_beijing_time()
+        # 早于截止日期的记录即为过期，YYYYMMDD 格式可直接按字符串比较
+        cutoff = (now - timedelta(days=retention_days)).strftime("%Y%m%d")
 
         for record_file in self.record_dir.glob("push_record_*.json"):
             try:
                 date_str = record_file.stem.replace("push_record_", "")
-                file_date = datetime.strptime(date_str, "%Y%m%d")
-                file_date = pytz.timezone("Asia/Shanghai").localize(file_date)
+                if len(date_str) != 8 or not date_str.isdigit():
+                    raise ValueError(f"日期格式不正确: {date_str}")
 
-                if (current_time - file_date).days > retention_days:
+                if date_str < cutoff:
                     record_file.unlink()
                     print(f"清理过期推送记录: {record_file.name}")
             except Exception as e:
@@ -281,8 +344,7 @@ class PushRecordManager:
             return False
 
         try:
-            with open(record_file, "r", encoding="utf-8") as f:
-                record = json.load(f)
+            record = json.loads(record_file.read_text(encoding="utf-8"))
             return record.get("pushed", False)
         except Exception as e:
             print(f"读取推送记录失败: {e}")
@@ -290,8 +352,8 @@ class PushRecordManager:
 
     def record_push(self, report_type: str):
         """记录推送"""
-        record_file = self.get_today_record_file()
         now = get_beijing_time()
+        record_file = self.get_today_record_file(now)
 
         record = {
             "pushed": True,
@@ -300,8 +362,10 @@ class PushRecordManager:
         }
 
         try:
-            with open(record_file, "w", encoding="utf-8") as f:
-                json.dump(record, f, ensure_ascii=False, indent=2)
+            # 先写临时文件再原子替换，避免中断时留下半截记录
+            tmp_file = record_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(encode_json_payload(record))
+            os.replace(tmp_file, record_file)
             print(f"推送记录已保存: {report_type} at {now.strftime('%H:%M:%S')}")
         except Exception as e:
             print(f"保存推送记录失败: {e}")
@@ -317,6 +381,15 @@ class PushRecordManager:
 class DataFetcher:
     """数据获取器"""
 
+    # 请求头固定不变，类级别共享，避免每次请求重新构建
+    REQUEST_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+        "Connection": "keep-alive",
+        "Cache-Control": "no-cache",
+    }
+
     def __init__(self, proxy_url: Optional[str] = None):
         self.proxy_url = proxy_url
 
@@ -326,7 +399,7 @@ class DataFetcher:
         max_retries: int = 2,
         min_retry_wait: int = 3,
         max_retry_wait: int = 5,
-    ) -> Tuple[Optional[str], str, str]:
+    ) -> Tuple[Optional[Dict], str, str]:
         """获取指定ID数据，支持重试"""
         if isinstance(id_info, tuple):
             id_value, alias = id_info
@@ -340,24 +413,15 @@ class DataFetcher:
         if self.proxy_url:
             proxies = {"http": self.proxy_url, "https": self.proxy_url}
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "Connection": "keep-alive",
-            "Cache-Control": "no-cache",
-        }
-
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
-                    url, proxies=proxies, headers=headers, timeout=10
+                response = HTTP_SESSION.get(
+                    url, proxies=proxies, headers=self.REQUEST_HEADERS, timeout=10
                 )
                 response.raise_for_status()
 
-                data_text = response.text
-                data_json = json.loads(data_text)
+                data_json = response.json()
 
                 status = data_json.get("status", "未知")
                 if status not in ["success", "cache"]:
@@ -365,7 +429,7 @@ class DataFetcher:
 
                 status_info = "最新数据" if status == "success" else "缓存数据"
                 print(f"获取 {id_value} 成功（{status_info}）")
-                return data_text, id_value, alias
+                return data_json, id_value, alias
 
             except Exception as e:
                 retries += 1
@@ -398,28 +462,23 @@ class DataFetcher:
                 name = id_value
 
             id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
+            data, _, _ = self.fetch_data(id_info)
 
-            if response:
+            if data:
                 try:
-                    data = json.loads(response)
-                    results[id_value] = {}
+                    source_results = results[id_value] = {}
                     for index, item in enumerate(data.get("items", []), 1):
                         title = item["title"]
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
+                        existing = source_results.get(title)
 
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
+                        if existing is not None:
+                            existing["ranks"].append(index)
                         else:
-                            results[id_value][title] = {
+                            source_results[title] = {
                                 "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
+                                "url": item.get("url", ""),
+                                "mobileUrl": item.get("mobileUrl", ""),
                             }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
                 except Exception as e:
                     print(f"处理 {id_value} 数据出错: {e}")
                     failed_ids.append(id_value)
@@ -440,52 +499,62 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
     """保存标题到文件"""
     file_path = get_output_path("txt", f"{format_time_filename()}.txt")
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        for id_value, title_data in results.items():
-            # id | name 或 id
-            name = id_to_name.get(id_value)
-            if name and name != id_value:
-                f.write(f"{id_value} | {name}\n")
+    # 先在内存中拼好全部内容，最后一次性写入
+    parts = []
+    append = parts.append
+
+    for id_value, title_data in results.items():
+        # id | name 或 id
+        name = id_to_name.get(id_value)
+        if name and name != id_value:
+            append(f"{id_value} | {name}\n")
+        else:
+            append(f"{id_value}\n")
+
+        # 按排名排序标题
+        sorted_titles = []
+        for title, info in title_data.items():
+            cleaned_title = clean_title(title)
+            if isinstance(info, dict):
+                ranks = info.get("ranks", [])
+                url = info.get("url", "")
+                mobile_url = info.get("mobileUrl", "")
             else:
-                f.write(f"{id_value}\n")
-
-            # 按排名排序标题
-            sorted_titles = []
-            for title, info in title_data.items():
-                cleaned_title = clean_title(title)
-                if isinstance(info, dict):
-                    ranks = info.get("ranks", [])
-                    url = info.get("url", "")
-                    mobile_url = info.get("mobileUrl", "")
-                else:
-                    ranks = info if isinstance(info, list) else []
-                    url = ""
-                    mobile_url = ""
+                ranks = info if isinstance(info, list) else []
+                url = ""
+                mobile_url = ""
 
-                rank = ranks[0] if ranks else 1
-                sorted_titles.append((rank, cleaned_title, url, mobile_url))
+            rank = ranks[0] if ranks else 1
+            sorted_titles.append((rank, cleaned_title, url, mobile_url))
 
-            sorted_titles.sort(key=lambda x: x[0])
+        sorted_titles.sort(key=lambda x: x[0])
 
-            for rank, cleaned_title, url, mobile_url in sorted_titles:
-                line = f"{rank}. {cleaned_title}"
+        for rank, cleaned_title, url, mobile_url in sorted_titles:
+            url_part = f" [URL:{url}]" if url else ""
+            mobile_part = f" [MOBILE:{mobile_url}]" if mobile_url else ""
+            append(f"{rank}. {cleaned_title}{url_part}{mobile_part}\n")
 
-                if url:
-                    line += f" [URL:{url}]"
-                if mobile_url:
-                    line += f" [MOBILE:{mobile_url}]"
-                f.write(line + "\n")
+        append("\n")
 
-            f.write("\n")
+    if failed_ids:
+        append("==== 以下ID请求失败 ====\n")
+        for id_value in failed_ids:
+            append(f"{id_value}\n")
 
-        if failed_ids:
-            f.write("==== 以下ID请求失败 ====\n")
-            for id_value in failed_ids:
-                f.write(f"{id_value}\n")
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
 
     return file_path
 
 
+@lru_cache(maxsize=256)
+def compile_word_pattern(words: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """将词列表编译为匹配小写标题的正则，一次扫描即可判断是否命中任一词"""
+    if not words:
+        return None
+    return re.compile("|".join(re.escape(word.lower()) for word in words))
+
+
 def load_frequency_words(
     frequency_file: Optional[str] = None,
 ) -> Tuple[List[Dict], List[str]]:
@@ -499,8 +568,7 @@ def load_frequency_words(
     if not frequency_path.exists():
         raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
 
-    with open(frequency_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = frequency_path.read_text(encoding="utf-8")
 
     word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
 
@@ -528,12 +596,16 @@ def load_frequency_words(
                 group_key = " ".join(group_normal_words)
             else:
                 group_key = " ".join(group_required_words)
+            group_key = sys.intern(group_key)
 
             processed_groups.append(
                 {
                     "required": group_required_words,
                     "normal": group_normal_words,
                     "group_key": group_key,
+                    # 预先处理好匹配用的数据，避免逐条标题重复转换小写
+                    "required_lower": tuple(w.lower() for w in group_required_words),
+                    "normal_pattern": compile_word_pattern(tuple(group_normal_words)),
                 }
             )
 
@@ -545,113 +617,142 @@ def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
     titles_by_id = {}
     id_to_name = {}
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-        sections = content.split("\n\n")
+    content = file_path.read_text(encoding="utf-8")
+    sections = content.split("\n\n")
 
-        for section in sections:
-            if not section.strip() or "==== 以下ID请求失败 ====" in section:
-                continue
+    for section in sections:
+        if not section.strip() or "==== 以下ID请求失败 ====" in section:
+            continue
 
-            lines = section.strip().split("\n")
-            if len(lines) < 2:
-                continue
+        lines = section.strip().split("\n")
+        if len(lines) < 2:
+            continue
 
-            # id | name 或 id
-            header_line = lines[0].strip()
-            if " | " in header_line:
-                parts = header_line.split(" | ", 1)
-                source_id = parts[0].strip()
-                name = parts[1].strip()
-                id_to_name[source_id] = name
-            else:
-                source_id = header_line
-                id_to_name[source_id] = source_id
-
-            titles_by_id[source_id] = {}
-
-            for line in lines[1:]:
-                if line.strip():
-                    try:
-                        title_part = line.strip()
-                        rank = None
-
-                        # 提取排名
-                        if ". " in title_part and title_part.split(". ")[0].isdigit():
-                            rank_str, title_part = title_part.split(". ", 1)
-                            rank = int(rank_str)
-
-                        # 提取 MOBILE URL
-                        mobile_url = ""
-                        if " [MOBILE:" in title_part:
-                            title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
-                            if mobile_part.endswith("]"):
-                                mobile_url = mobile_part[:-1]
-
-                        # 提取 URL
-                        url = ""
-                        if " [URL:" in title_part:
-                            title_part, url_part = title_part.rsplit(" [URL:", 1)
-                            if url_part.endswith("]"):
-                                url = url_part[:-1]
-
-                        title = clean_title(title_part.strip())
-                        ranks = [rank] if rank is not None else [1]
-
-                        titles_by_id[source_id][title] = {
-                            "ranks": ranks,
-                            "url": url,
-                            "mobileUrl": mobile_url,
-                        }
+        # id | name 或 id
+        header_line = lines[0].strip()
+        # 平台ID会在各文件、各统计字典中反复作为键使用，驻留后可共享同一对象
+        source_part, sep, name = header_line.partition(" | ")
+        if sep:
+            source_id = sys.intern(source_part.strip())
+            id_to_name[source_id] = name.strip()
+        else:
+            source_id = sys.intern(header_line)
+            id_to_name[source_id] = source_id
+
+        titles_by_id[source_id] = {}
+
+        for line in lines[1:]:
+            if line.strip():
+                try:
+                    title_part = line.strip()
+                    rank = None
+
+                    # 提取排名，只切分一次
+                    rank_str, sep, rest = title_part.partition(". ")
+                    if sep and rank_str.isdigit():
+                        rank = int(rank_str)
+                        title_part = rest
+
+                    # 提取 MOBILE URL
+                    mobile_url = ""
+                    head, sep, mobile_part = title_part.rpartition(" [MOBILE:")
+                    if sep:
+                        title_part = head
+                        if mobile_part.endswith("]"):
+                            mobile_url = mobile_part[:-1]
+
+                    # 提取 URL
+                    url = ""
+                    head, sep, url_part = title_part.rpartition(" [URL:")
+                    if sep:
+                        title_part = head
+                        if url_part.endswith("]"):
+                            url = url_part[:-1]
 
-                    except Exception as e:
-                        print(f"解析标题行出错: {line}, 错误: {e}")
+                    title = clean_title(title_part.strip())
+                    ranks = {rank if rank is not None else 1}
+
+                    titles_by_id[source_id][title] = {
+                        "ranks": ranks,
+                        "url": url,
+                        "mobileUrl": mobile_url,
+                    }
+
+                except Exception as e:
+                    print(f"解析标题行出错: {line}, 错误: {e}")
 
     return titles_by_id, id_to_name
 
 
+@lru_cache(maxsize=512)
+def parse_file_titles_cached(
+    file_path: str, mtime_ns: int, size: int
+) -> Tuple[Dict, Dict]:
+    """按 (路径, 修改时间, 大小) 缓存解析结果，返回值只读，调用方不得修改"""
+    return parse_file_titles(Path(file_path))
+
+
+def load_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
+    """读取txt文件标题数据，文件未变化时直接复用已解析的结果"""
+    stat = file_path.stat()
+    return parse_file_titles_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
 def read_all_today_titles(
     current_platform_ids: Optional[List[str]] = None,
-) -> Tuple[Dict, Dict, Dict]:
-    """读取当天所有标题文件，支持按当前监控平台过滤"""
+) -> Tuple[Dict, Dict, Dict, Dict]:
+    """读取当天所有标题文件，支持按当前监控平台过滤，同时返回最新批次的新增标题"""
     date_folder = format_date_folder()
     txt_dir = Path("output") / date_folder / "txt"
 
     if not txt_dir.exists():
-        return {}, {}, {}
+        return {}, {}, {}, {}
 
     all_results = {}
     final_id_to_name = {}
     title_info = {}
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
+    # 平台过滤集合只构建一次，遍历时直接跳过不在监控列表中的平台
+    platform_ids = (
+        frozenset(current_platform_ids) if current_platform_ids is not None else None
+    )
+
+    files = list_txt_files(txt_dir)
 
     for file_path in files:
         time_info = file_path.stem
 
-        titles_by_id, file_id_to_name = parse_file_titles(file_path)
-
-        if current_platform_ids is not None:
-            filtered_titles_by_id = {}
-            filtered_id_to_name = {}
+        titles_by_id, file_id_to_name = load_file_titles(file_path)
 
-            for source_id, title_data in titles_by_id.items():
-                if source_id in current_platform_ids:
-                    filtered_titles_by_id[source_id] = title_data
-                    if source_id in file_id_to_name:
-                        filtered_id_to_name[source_id] = file_id_to_name[source_id]
-
-            titles_by_id = filtered_titles_by_id
-            file_id_to_name = filtered_id_to_name
+        for source_id, title_data in titles_by_id.items():
+            if platform_ids is not None and source_id not in platform_ids:
+                continue
 
-        final_id_to_name.update(file_id_to_name)
+            if source_id in file_id_to_name:
+                final_id_to_name[source_id] = file_id_to_name[source_id]
 
-        for source_id, title_data in titles_by_id.items():
             process_source_data(
                 source_id, title_data, time_info, all_results, title_info
             )
 
-    return all_results, final_id_to_name, title_info
+    # 新增标题：最新批次中首次出现时间即为该批次的标题，与 detect_latest_new_titles 一致
+    new_titles = {}
+    if len(files) >= 2:
+        latest_time = files[-1].stem
+        for source_id, latest_source_titles in titles_by_id.items():
+            if platform_ids is not None and source_id not in platform_ids:
+                continue
+
+            source_info = title_info[source_id]
+            source_new_titles = {
+                title: title_data
+                for title, title_data in latest_source_titles.items()
+                if source_info[title]["first_time"] == latest_time
+            }
+            if source_new_titles:
+                new_titles[source_id] = source_new_titles
+
+    return all_results, final_id_to_name, title_info, new_titles
 
 
 def process_source_data(
@@ -662,18 +763,19 @@ def process_source_data(
     title_info: Dict,
 ) -> None:
     """处理来源数据，合并重复标题"""
-    if source_id not in all_results:
-        all_results[source_id] = title_data
-
-        if source_id not in title_info:
-            title_info[source_id] = {}
-
-        for title, data in title_data.items():
-            ranks = data.get("ranks", [])
-            url = data.get("url", "")
-            mobile_url = data.get("mobileUrl", "")
-
-            title_info[source_id][title] = {
+    source_results = all_results.setdefault(source_id, {})
+    source_info = title_info.setdefault(source_id, {})
+
+    for title, data in title_data.items():
+        ranks = data.get("ranks", [])
+        url = data.get("url", "")
+        mobile_url = data.get("mobileUrl", "")
+
+        existing_data = source_results.get(title)
+        if existing_data is None:
+            # 解析结果来自缓存，这里只引用不修改，合并时总是生成新记录
+            source_results[title] = data
+            source_info[title] = {
                 "first_time": time_info,
                 "last_time": time_info,
                 "count": 1,
@@ -681,50 +783,28 @@ def process_source_data(
                 "url": url,
                 "mobileUrl": mobile_url,
             }
-    else:
-        for title, data in title_data.items():
-            ranks = data.get("ranks", [])
-            url = data.get("url", "")
-            mobile_url = data.get("mobileUrl", "")
+        else:
+            existing_ranks = existing_data.get("ranks", [])
+            existing_url = existing_data.get("url", "")
+            existing_mobile_url = existing_data.get("mobileUrl", "")
 
-            if title not in all_results[source_id]:
-                all_results[source_id][title] = {
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
-                title_info[source_id][title] = {
-                    "first_time": time_info,
-                    "last_time": time_info,
-                    "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
-            else:
-                existing_data = all_results[source_id][title]
-                existing_ranks = existing_data.get("ranks", [])
-                existing_url = existing_data.get("url", "")
-                existing_mobile_url = existing_data.get("mobileUrl", "")
-
-                merged_ranks = existing_ranks.copy()
-                for rank in ranks:
-                    if rank not in merged_ranks:
-                        merged_ranks.append(rank)
-
-                all_results[source_id][title] = {
-                    "ranks": merged_ranks,
-                    "url": existing_url or url,
-                    "mobileUrl": existing_mobile_url or mobile_url,
-                }
+            # 排名以集合存储，合并即取并集
+            merged_ranks = {*existing_ranks, *ranks}
+
+            source_results[title] = {
+                "ranks": merged_ranks,
+                "url": existing_url or url,
+                "mobileUrl": existing_mobile_url or mobile_url,
+            }
 
-                title_info[source_id][title]["last_time"] = time_info
-                title_info[source_id][title]["ranks"] = merged_ranks
-                title_info[source_id][title]["count"] += 1
-                if not title_info[source_id][title].get("url"):
-                    title_info[source_id][title]["url"] = url
-                if not title_info[source_id][title].get("mobileUrl"):
-                    title_info[source_id][title]["mobileUrl"] = mobile_url
+            info = source_info[title]
+            info["last_time"] = time_info
+            info["ranks"] = merged_ranks
+            info["count"] += 1
+            if not info.get("url"):
+                info["url"] = url
+            if not info.get("mobileUrl"):
+                info["mobileUrl"] = mobile_url
 
 
 def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -> Dict:
@@ -735,40 +815,30 @@ def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -
     if not txt_dir.exists():
         return {}
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
+    files = list_txt_files(txt_dir)
     if len(files) < 2:
         return {}
 
     # 解析最新文件
     latest_file = files[-1]
-    latest_titles, _ = parse_file_titles(latest_file)
+    latest_titles, _ = load_file_titles(latest_file)
 
     # 如果指定了当前平台列表，过滤最新文件数据
     if current_platform_ids is not None:
-        filtered_latest_titles = {}
-        for source_id, title_data in latest_titles.items():
-            if source_id in current_platform_ids:
-                filtered_latest_titles[source_id] = title_data
-        latest_titles = filtered_latest_titles
+        platform_ids = frozenset(current_platform_ids)
+        latest_titles = {
+            source_id: title_data
+            for source_id, title_data in latest_titles.items()
+            if source_id in platform_ids
+        }
 
-    # 汇总历史标题（按平台过滤）
+    # 汇总历史标题，只关心最新批次中出现的平台（已按平台过滤），标题直接并入集合
     historical_titles = {}
     for file_path in files[:-1]:
-        historical_data, _ = parse_file_titles(file_path)
-
-        # 过滤历史数据
-        if current_platform_ids is not None:
-            filtered_historical_data = {}
-            for source_id, title_data in historical_data.items():
-                if source_id in current_platform_ids:
-                    filtered_historical_data[source_id] = title_data
-            historical_data = filtered_historical_data
-
+        historical_data, _ = load_file_titles(file_path)
         for source_id, titles_data in historical_data.items():
-            if source_id not in historical_titles:
-                historical_titles[source_id] = set()
-            for title in titles_data.keys():
-                historical_titles[source_id].add(title)
+            if source_id in latest_titles:
+                historical_titles.setdefault(source_id, set()).update(titles_data)
 
     # 找出新增标题
     new_titles = {}
@@ -798,21 +868,23 @@ def calculate_news_weight(
     count = title_data.get("count", len(ranks))
     weight_config = CONFIG["WEIGHT_CONFIG"]
 
-    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
+    # 一次遍历同时累计排名得分和高排名次数
+    rank_score_sum = 0
+    high_rank_count = 0
     for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
+        rank_score_sum += 11 - (rank if rank < 10 else 10)
+        if rank <= rank_threshold:
+            high_rank_count += 1
+    rank_total = len(ranks)
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
+    rank_weight = rank_score_sum / rank_total
 
     # 频次权重：min(出现次数, 10) × 10
     frequency_weight = min(count, 10) * 10
 
     # 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
+    hotness_weight = high_rank_count / rank_total * 100
 
     total_weight = (
         rank_weight * weight_config["RANK_WEIGHT"]
@@ -823,44 +895,73 @@ def calculate_news_weight(
     return total_weight
 
 
-def matches_word_groups(
-    title: str, word_groups: List[Dict], filter_words: List[str]
-) -> bool:
-    """检查标题是否匹配词组规则"""
-    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
+def compile_group_prefilter(word_groups: List[Dict]) -> Optional[re.Pattern]:
+    """合并所有词组的必须词与普通词，标题不含其中任一词时不可能命中任何词组
+
+    存在既无必须词也无普通词的词组时无法预筛，返回 None
+    """
+    words = []
+    for group in word_groups:
+        group_words = (*group["required_lower"], *group["normal"])
+        if not group_words:
+            return None
+        words.extend(group_words)
+    return compile_word_pattern(tuple(words))
 
-    title_lower = title.lower()
 
-    # 过滤词检查
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
-        return False
+def find_matching_group(
+    title_lower: str,
+    word_groups: List[Dict],
+    filter_pattern: Optional[re.Pattern],
+    prefilter_pattern: Optional[re.Pattern] = None,
+) -> Optional[str]:
+    """返回小写标题命中的第一个词组的 group_key，被过滤或未命中返回 None"""
+    # 先用合并后的预筛正则一次排除绝大多数不相关标题
+    if prefilter_pattern and not prefilter_pattern.search(title_lower):
+        return None
 
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
+    if filter_pattern and filter_pattern.search(title_lower):
+        return None
 
+    for group in word_groups:
         # 必须词检查
-        if required_words:
-            all_required_present = all(
-                req_word.lower() in title_lower for req_word in required_words
-            )
-            if not all_required_present:
-                continue
+        if not all(word in title_lower for word in group["required_lower"]):
+            continue
 
         # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                normal_word.lower() in title_lower for normal_word in normal_words
-            )
-            if not any_normal_present:
-                continue
+        normal_pattern = group["normal_pattern"]
+        if normal_pattern and not normal_pattern.search(title_lower):
+            continue
+
+        return group["group_key"]
+
+    return None
+
 
+def matches_word_groups(
+    title: str,
+    word_groups: List[Dict],
+    filter_words: List[str],
+    title_lower: Optional[str] = None,
+    prefilter_pattern: Optional[re.Pattern] = None,
+) -> bool:
+    """检查标题是否匹配词组规则
+
+    调用方已有小写标题时可直接传入 title_lower，批量匹配时可传入
+    compile_group_prefilter 的结果作为预筛
+    """
+    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
+    if not word_groups:
         return True
 
-    return False
+    if title_lower is None:
+        title_lower = title.lower()
+
+    filter_pattern = compile_word_pattern(tuple(filter_words))
+    return (
+        find_matching_group(title_lower, word_groups, filter_pattern, prefilter_pattern)
+        is not None
+    )
 
 
 def format_time_display(first_time: str, last_time: str) -> str:
@@ -873,33 +974,30 @@ def format_time_display(first_time: str, last_time: str) -> str:
         return f"[{first_time} ~ {last_time}]"
 
 
-def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str) -> str:
+# 各平台排名高亮标签 (开始, 结束)
+DEFAULT_RANK_HIGHLIGHT_TAGS = ("**", "**")
+RANK_HIGHLIGHT_TAGS = {
+    "html": ("<font color='red'><strong>", "</strong></font>"),
+    "feishu": ("<font color='red'>**", "**</font>"),
+    "dingtalk": ("**", "**"),
+    "wework": ("**", "**"),
+    "telegram": ("<b>", "</b>"),
+}
+
+
+def format_rank_display(
+    ranks: Union[List[int], Set[int]], rank_threshold: int, format_type: str
+) -> str:
     """统一的排名格式化方法"""
     if not ranks:
         return ""
 
-    unique_ranks = sorted(set(ranks))
-    min_rank = unique_ranks[0]
-    max_rank = unique_ranks[-1]
-
-    if format_type == "html":
-        highlight_start = "<font color='red'><strong>"
-        highlight_end = "</strong></font>"
-    elif format_type == "feishu":
-        highlight_start = "<font color='red'>**"
-        highlight_end = "**</font>"
-    elif format_type == "dingtalk":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "wework":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "telegram":
-        highlight_start = "<b>"
-        highlight_end = "</b>"
-    else:
-        highlight_start = "**"
-        highlight_end = "**"
+    min_rank = min(ranks)
+    max_rank = max(ranks)
+
+    highlight_start, highlight_end = RANK_HIGHLIGHT_TAGS.get(
+        format_type, DEFAULT_RANK_HIGHLIGHT_TAGS
+    )
 
     if min_rank <= rank_threshold:
         if min_rank == max_rank:
@@ -928,8 +1026,19 @@ def count_word_frequency(
     # 如果没有配置词组，创建一个包含所有新闻的虚拟词组
     if not word_groups:
         print("频率词配置为空，将显示所有新闻")
-        word_groups = [{"required": [], "normal": [], "group_key": "全部新闻"}]
+        word_groups = [
+            {
+                "required": [],
+                "normal": [],
+                "group_key": "全部新闻",
+                "required_lower": (),
+                "normal_pattern": None,
+            }
+        ]
         filter_words = []  # 清空过滤词，显示所有新闻
+        show_all_news = True  # 所有标题直接归入虚拟词组，无需逐条匹配
+    else:
+        show_all_news = False
 
     is_first_today = is_first_crawl_today()
 
@@ -1002,6 +1111,9 @@ def count_word_frequency(
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
+    filter_pattern = compile_word_pattern(tuple(filter_words))
+    prefilter_pattern = compile_group_prefilter(word_groups)
+
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
@@ -1012,13 +1124,15 @@ def count_word_frequency(
             if title in processed_titles.get(source_id, {}):
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words
-            )
-
-            if not matches_frequency_words:
-                continue
+            # 单次扫描找到第一个匹配的词组，未匹配则跳过
+            if show_all_news:
+                group_key = "全部新闻"
+            else:
+                group_key = find_matching_group(
+                    title.lower(), word_groups, filter_pattern, prefilter_pattern
+                )
+                if group_key is None:
+                    continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
             if (mode == "incremental" and all_news_are_new) or (
@@ -1030,115 +1144,82 @@ def count_word_frequency(
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组
-            title_lower = title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time)
-
-                source_name = id_to_name.get(source_id, source_id)
+            word_stats[group_key]["count"] += 1
+            if source_id not in word_stats[group_key]["titles"]:
+                word_stats[group_key]["titles"][source_id] = []
 
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = source_ranks if source_ranks else []
+            url = source_url
+            mobile_url = source_mobile_url
 
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            # 对于 current 模式，从历史统计信息中获取完整数据
+            if (
+                mode == "current"
+                and title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+            elif (
+                title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time)
+
+            source_name = id_to_name.get(source_id, source_id)
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif new_titles and source_id in new_titles:
+                # 检查是否在新增列表中
+                new_titles_for_source = new_titles[source_id]
+                is_new = title in new_titles_for_source
+
+            word_stats[group_key]["titles"][source_id].append(
+                {
+                    "title": title,
+                    "source_name": source_name,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": time_display,
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobile_url": mobile_url,
+                    "is_new": is_new,
+                }
+            )
 
-                break
+            if source_id not in processed_titles:
+                processed_titles[source_id] = {}
+            processed_titles[source_id][title] = True
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -1224,6 +1305,23 @@ def count_word_frequency(
 
 
 # === 报告生成 ===
+def get_rank_style(ranks, rank_threshold: int) -> Tuple[str, str]:
+    """计算排名文本与等级样式，无排名时均为空"""
+    if not ranks:
+        return "", ""
+    min_rank = min(ranks)
+    max_rank = max(ranks)
+    if min_rank <= 3:
+        rank_class = "top"
+    elif min_rank <= rank_threshold:
+        rank_class = "high"
+    else:
+        rank_class = ""
+    if min_rank == max_rank:
+        return str(min_rank), rank_class
+    return f"{min_rank}-{max_rank}", rank_class
+
+
 def prepare_report_data(
     stats: List[Dict],
     failed_ids: Optional[List] = None,
@@ -1242,10 +1340,22 @@ def prepare_report_data(
         filtered_new_titles = {}
         if new_titles and id_to_name:
             word_groups, filter_words = load_frequency_words()
+            prefilter_pattern = compile_group_prefilter(word_groups)
+            # 同一标题常出现在多个平台，匹配结果按标题缓存
+            match_cache = {}
             for source_id, titles_data in new_titles.items():
                 filtered_titles = {}
                 for title, title_data in titles_data.items():
-                    if matches_word_groups(title, word_groups, filter_words):
+                    matched = match_cache.get(title)
+                    if matched is None:
+                        matched = matches_word_groups(
+                            title,
+                            word_groups,
+                            filter_words,
+                            prefilter_pattern=prefilter_pattern,
+                        )
+                        match_cache[title] = matched
+                    if matched:
                         filtered_titles[title] = title_data
                 if filtered_titles:
                     filtered_new_titles[source_id] = filtered_titles
@@ -1259,6 +1369,9 @@ def prepare_report_data(
                     url = title_data.get("url", "")
                     mobile_url = title_data.get("mobileUrl", "")
                     ranks = title_data.get("ranks", [])
+                    rank_text, rank_class = get_rank_style(
+                        ranks, CONFIG["RANK_THRESHOLD"]
+                    )
 
                     processed_title = {
                         "title": title,
@@ -1267,6 +1380,8 @@ def prepare_report_data(
                         "count": 1,
                         "ranks": ranks,
                         "rank_threshold": CONFIG["RANK_THRESHOLD"],
+                        "rank_text": rank_text,
+                        "rank_class": rank_class,
                         "url": url,
                         "mobile_url": mobile_url,
                         "is_new": True,
@@ -1287,27 +1402,28 @@ def prepare_report_data(
         if stat["count"] <= 0:
             continue
 
-        processed_titles = []
+        # count_word_frequency 产出的标题记录已是报告所需格式，直接复用，只补充排名样式
         for title_data in stat["titles"]:
-            processed_title = {
-                "title": title_data["title"],
-                "source_name": title_data["source_name"],
-                "time_display": title_data["time_display"],
-                "count": title_data["count"],
-                "ranks": title_data["ranks"],
-                "rank_threshold": title_data["rank_threshold"],
-                "url": title_data.get("url", ""),
-                "mobile_url": title_data.get("mobileUrl", ""),
-                "is_new": title_data.get("is_new", False),
-            }
-            processed_titles.append(processed_title)
+            title_data["rank_text"], title_data["rank_class"] = get_rank_style(
+                title_data["ranks"], title_data["rank_threshold"]
+            )
+
+        # 确定热度等级
+        count = stat["count"]
+        if count >= 10:
+            count_class = "hot"
+        elif count >= 5:
+            count_class = "warm"
+        else:
+            count_class = ""
 
         processed_stats.append(
             {
                 "word": stat["word"],
-                "count": stat["count"],
+                "count": count,
+                "count_class": count_class,
                 "percentage": stat.get("percentage", 0),
-                "titles": processed_titles,
+                "titles": stat["titles"],
             }
         )
 
@@ -1321,139 +1437,119 @@ def prepare_report_data(
     }
 
 
+# 各平台标题格式模板
+TITLE_TEMPLATES = {
+    "feishu": {
+        "link": "[{title}]({url})",
+        "source": "<font color='grey'>[{source}]</font> ",
+        "time": " <font color='grey'>- {time}</font>",
+        "count": " <font color='green'>({count}次)</font>",
+    },
+    "dingtalk": {
+        "link": "[{title}]({url})",
+        "source": "[{source}] ",
+        "time": " - {time}",
+        "count": " ({count}次)",
+    },
+    "wework": {
+        "link": "[{title}]({url})",
+        "source": "[{source}] ",
+        "time": " - {time}",
+        "count": " ({count}次)",
+    },
+    "telegram": {
+        "link": '<a href="{url}">{title}</a>',
+        "escape_link_title": True,
+        "source": "[{source}] ",
+        "time": " <code>- {time}</code>",
+        "count": " <code>({count}次)</code>",
+    },
+}
+
+
 def format_title_for_platform(
-    platform: str, title_data: Dict, show_source: bool = True
+    platform: str,
+    title_data: Dict,
+    show_source: bool = True,
+    is_new: Optional[bool] = None,
 ) -> str:
-    """统一的标题格式化方法"""
-    rank_display = format_rank_display(
-        title_data["ranks"], title_data["rank_threshold"], platform
-    )
-
-    link_url = title_data["mobile_url"] or title_data["url"]
+    """统一的标题格式化方法，is_new 不为 None 时覆盖 title_data 中的新增标记"""
+    if is_new is None:
+        is_new = title_data.get("is_new")
 
     cleaned_title = clean_title(title_data["title"])
 
-    if platform == "feishu":
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
-        else:
-            formatted_title = cleaned_title
-
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
-
-        if show_source:
-            result = f"<font color='grey'>[{title_data['source_name']}]</font> {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
-
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" <font color='grey'>- {title_data['time_display']}</font>"
-        if title_data["count"] > 1:
-            result += f" <font color='green'>({title_data['count']}次)</font>"
-
-        return result
-
-    elif platform == "dingtalk":
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
-        else:
-            formatted_title = cleaned_title
-
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
-
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
-
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" - {title_data['time_display']}"
-        if title_data["count"] > 1:
-            result += f" ({title_data['count']}次)"
+    if platform == "html":
+        return format_html_title(title_data, cleaned_title, is_new)
 
-        return result
+    templates = TITLE_TEMPLATES.get(platform)
+    if templates is None:
+        return cleaned_title
 
-    elif platform == "wework":
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
-        else:
-            formatted_title = cleaned_title
+    rank_display = format_rank_display(
+        title_data["ranks"], title_data["rank_threshold"], platform
+    )
+    link_url = title_data["mobile_url"] or title_data["url"]
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+    if link_url:
+        if templates.get("escape_link_title"):
+            cleaned_title = html_escape(cleaned_title)
+        formatted_title = templates["link"].format(title=cleaned_title, url=link_url)
+    else:
+        formatted_title = cleaned_title
 
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
+    title_prefix = "🆕 " if is_new else ""
 
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" - {title_data['time_display']}"
-        if title_data["count"] > 1:
-            result += f" ({title_data['count']}次)"
+    if show_source:
+        result = (
+            templates["source"].format(source=title_data["source_name"])
+            + title_prefix
+            + formatted_title
+        )
+    else:
+        result = f"{title_prefix}{formatted_title}"
 
-        return result
+    if rank_display:
+        result += f" {rank_display}"
+    if title_data["time_display"]:
+        result += templates["time"].format(time=title_data["time_display"])
+    if title_data["count"] > 1:
+        result += templates["count"].format(count=title_data["count"])
 
-    elif platform == "telegram":
-        if link_url:
-            formatted_title = f'<a href="{link_url}">{html_escape(cleaned_title)}</a>'
-        else:
-            formatted_title = cleaned_title
+    return result
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
 
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
+def format_html_title(title_data: Dict, cleaned_title: str, is_new: bool) -> str:
+    """HTML 平台的标题格式化"""
+    rank_display = format_rank_display(
+        title_data["ranks"], title_data["rank_threshold"], "html"
+    )
 
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" <code>- {title_data['time_display']}</code>"
-        if title_data["count"] > 1:
-            result += f" <code>({title_data['count']}次)</code>"
+    link_url = title_data["mobile_url"] or title_data["url"]
 
-        return result
+    escaped_title = html_escape(cleaned_title)
+    escaped_source_name = html_escape(title_data["source_name"])
 
-    elif platform == "html":
-        rank_display = format_rank_display(
-            title_data["ranks"], title_data["rank_threshold"], "html"
+    if link_url:
+        escaped_url = html_escape(link_url)
+        formatted_title = f'[{escaped_source_name}] <a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+    else:
+        formatted_title = (
+            f'[{escaped_source_name}] <span class="no-link">{escaped_title}</span>'
         )
 
-        link_url = title_data["mobile_url"] or title_data["url"]
+    if rank_display:
+        formatted_title += f" {rank_display}"
+    if title_data["time_display"]:
+        escaped_time = html_escape(title_data["time_display"])
+        formatted_title += f" <font color='grey'>- {escaped_time}</font>"
+    if title_data["count"] > 1:
+        formatted_title += f" <font color='green'>({title_data['count']}次)</font>"
 
-        escaped_title = html_escape(cleaned_title)
-        escaped_source_name = html_escape(title_data["source_name"])
+    if is_new:
+        formatted_title = f"<div class='new-title'>🆕 {formatted_title}</div>"
 
-        if link_url:
-            escaped_url = html_escape(link_url)
-            formatted_title = f'[{escaped_source_name}] <a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-        else:
-            formatted_title = (
-                f'[{escaped_source_name}] <span class="no-link">{escaped_title}</span>'
-            )
-
-        if rank_display:
-            formatted_title += f" {rank_display}"
-        if title_data["time_display"]:
-            escaped_time = html_escape(title_data["time_display"])
-            formatted_title += f" <font color='grey'>- {escaped_time}</font>"
-        if title_data["count"] > 1:
-            formatted_title += f" <font color='green'>({title_data['count']}次)</font>"
-
-        if title_data.get("is_new"):
-            formatted_title = f"<div class='new-title'>🆕 {formatted_title}</div>"
-
-        return formatted_title
-
-    else:
-        return cleaned_title
+    return formatted_title
 
 
 def generate_html_report(
@@ -1480,29 +1576,22 @@ def generate_html_report(
 
     report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
 
-    html_content = render_html_content(
-        report_data, total_titles, is_daily_summary, mode
-    )
+    # 直接写出各片段，不再拼接完整字符串
+    html_parts = render_html_parts(report_data, total_titles, is_daily_summary, mode)
 
     with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+        f.writelines(html_parts)
 
     if is_daily_summary:
         root_file_path = Path("index.html")
         with open(root_file_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            f.writelines(html_parts)
 
     return file_path
 
 
-def render_html_content(
-    report_data: Dict,
-    total_titles: int,
-    is_daily_summary: bool = False,
-    mode: str = "daily",
-) -> str:
-    """渲染HTML内容"""
-    html = """
+# HTML 报告中固定不变的头部（样式）与尾部（脚本），只在导入时构建一次
+HTML_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -1928,63 +2017,180 @@ def render_html_content(
                         <span class="info-label">报告类型</span>
                         <span class="info-value">"""
 
-    # 处理报告类型显示
-    if is_daily_summary:
-        if mode == "current":
-            html += "当前榜单"
-        elif mode == "incremental":
-            html += "增量模式"
-        else:
-            html += "当日汇总"
-    else:
-        html += "实时分析"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">新闻总数</span>
-                        <span class="info-value">"""
-
-    html += f"{total_titles} 条"
-
-    # 计算筛选后的热点新闻数量
-    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">热点新闻</span>
-                        <span class="info-value">"""
-
-    html += f"{hot_news_count} 条"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
+HTML_TAIL = """
+            </div>
+            
+            <div class="footer">
+                <div class="footer-content">
+                    由 <span class="project-name">TrendRadar</span> 生成 · 
+                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
+                        GitHub 开源项目
+                    </a>
+                </div>
+            </div>
+        </div>
+        
+        <script>
+            async function saveAsImage() {
+                const button = document.querySelector('.save-btn');
+                const originalText = button.textContent;
+                
+                try {
+                    button.textContent = '生成中...';
+                    button.disabled = true;
+                    window.scrollTo(0, 0);
+                    
+                    // 等待页面稳定
+                    await new Promise(resolve => setTimeout(resolve, 200));
+                    
+                    // 截图前隐藏按钮
+                    button.style.visibility = 'hidden';
+                    
+                    // 再次等待确保按钮完全隐藏
+                    await new Promise(resolve => setTimeout(resolve, 100));
+                    
+                    const container = document.querySelector('.container');
+                    
+                    // 获取容器的精确位置和尺寸
+                    const rect = container.getBoundingClientRect();
+                    const computedStyle = window.getComputedStyle(container);
+                    
+                    const canvas = await html2canvas(container, {
+                        backgroundColor: '#ffffff',
+                        scale: 1.5,
+                        useCORS: true,
+                        allowTaint: false,
+                        imageTimeout: 10000,
+                        removeContainer: false,
+                        foreignObjectRendering: false,
+                        logging: false,
+                        width: container.offsetWidth,
+                        height: container.offsetHeight,
+                        x: 0,
+                        y: 0,
+                        scrollX: 0,
+                        scrollY: 0,
+                        windowWidth: window.innerWidth,
+                        windowHeight: window.innerHeight
+                    });
+                    
+                    button.style.visibility = 'visible';
+                    
+                    const link = document.createElement('a');
+                    const now = new Date();
+                    const filename = `TrendRadar_热点新闻分析_${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}_${String(now.getHours()).padStart(2, '0')}${String(now.getMinutes()).padStart(2, '0')}.png`;
+                    
+                    link.download = filename;
+                    link.href = canvas.toDataURL('image/png', 1.0);
+                    
+                    // 触发下载
+                    document.body.appendChild(link);
+                    link.click();
+                    document.body.removeChild(link);
+                    
+                    button.textContent = '保存成功!';
+                    setTimeout(() => {
+                        button.textContent = originalText;
+                        button.disabled = false;
+                    }, 2000);
+                    
+                } catch (error) {
+                    button.style.visibility = 'visible';
+                    button.textContent = '保存失败';
+                    setTimeout(() => {
+                        button.textContent = originalText;
+                        button.disabled = false;
+                    }, 2000);
+                }
+            }
+            
+            document.addEventListener('DOMContentLoaded', function() {
+                window.scrollTo(0, 0);
+            });
+        </script>
+    </body>
+    </html>
+    """
+
+
+def render_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+) -> str:
+    """渲染HTML内容"""
+    return "".join(
+        render_html_parts(report_data, total_titles, is_daily_summary, mode)
+    )
+
+
+def render_html_parts(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+) -> List[str]:
+    """按顺序渲染HTML内容片段，写文件时可直接 writelines"""
+    parts = [HTML_HEAD]
+
+    # 处理报告类型显示
+    if is_daily_summary:
+        if mode == "current":
+            parts.append("当前榜单")
+        elif mode == "incremental":
+            parts.append("增量模式")
+        else:
+            parts.append("当日汇总")
+    else:
+        parts.append("实时分析")
+
+    parts.append("""</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">新闻总数</span>
+                        <span class="info-value">""")
+
+    parts.append(f"{total_titles} 条")
+
+    # 计算筛选后的热点新闻数量
+    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
+
+    parts.append("""</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">热点新闻</span>
+                        <span class="info-value">""")
+
+    parts.append(f"{hot_news_count} 条")
+
+    parts.append("""</span>
+                    </div>
+                    <div class="info-item">
                         <span class="info-label">生成时间</span>
-                        <span class="info-value">"""
+                        <span class="info-value">""")
 
     now = get_beijing_time()
-    html += now.strftime("%m-%d %H:%M")
+    parts.append(now.strftime("%m-%d %H:%M"))
 
-    html += """</span>
+    parts.append("""</span>
                     </div>
                 </div>
             </div>
             
-            <div class="content">"""
+            <div class="content">""")
 
     # 处理失败ID错误信息
     if report_data["failed_ids"]:
-        html += """
+        parts.append("""
                 <div class="error-section">
                     <div class="error-title">⚠️ 请求失败的平台</div>
-                    <ul class="error-list">"""
+                    <ul class="error-list">""")
         for id_value in report_data["failed_ids"]:
-            html += f'<li class="error-item">{html_escape(id_value)}</li>'
-        html += """
+            parts.append(f'<li class="error-item">{html_escape(id_value)}</li>')
+        parts.append("""
                     </ul>
-                </div>"""
+                </div>""")
 
     # 处理主要统计数据
     if report_data["stats"]:
@@ -1992,18 +2198,10 @@ def render_html_content(
 
         for i, stat in enumerate(report_data["stats"], 1):
             count = stat["count"]
-
-            # 确定热度等级
-            if count >= 10:
-                count_class = "hot"
-            elif count >= 5:
-                count_class = "warm"
-            else:
-                count_class = ""
-
+            count_class = stat["count_class"]
             escaped_word = html_escape(stat["word"])
 
-            html += f"""
+            parts.append(f"""
                 <div class="word-group">
                     <div class="word-header">
                         <div class="word-info">
@@ -2011,41 +2209,25 @@ def render_html_content(
                             <div class="word-count {count_class}">{count} 条</div>
                         </div>
                         <div class="word-index">{i}/{total_count}</div>
-                    </div>"""
+                    </div>""")
 
             # 处理每个词组下的新闻标题，给每条新闻标上序号
             for j, title_data in enumerate(stat["titles"], 1):
                 is_new = title_data.get("is_new", False)
                 new_class = "new" if is_new else ""
 
-                html += f"""
+                parts.append(f"""
                     <div class="news-item {new_class}">
                         <div class="news-number">{j}</div>
                         <div class="news-content">
                             <div class="news-header">
-                                <span class="source-name">{html_escape(title_data["source_name"])}</span>"""
+                                <span class="source-name">{html_escape(title_data["source_name"])}</span>""")
 
                 # 处理排名显示
-                ranks = title_data.get("ranks", [])
-                if ranks:
-                    min_rank = min(ranks)
-                    max_rank = max(ranks)
-                    rank_threshold = title_data.get("rank_threshold", 10)
-
-                    # 确定排名等级
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= rank_threshold:
-                        rank_class = "high"
-                    else:
-                        rank_class = ""
-
-                    if min_rank == max_rank:
-                        rank_text = str(min_rank)
-                    else:
-                        rank_text = f"{min_rank}-{max_rank}"
-
-                    html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
+                rank_text = title_data["rank_text"]
+                if rank_text:
+                    rank_class = title_data["rank_class"]
+                    parts.append(f'<span class="rank-num {rank_class}">{rank_text}</span>')
 
                 # 处理时间显示
                 time_display = title_data.get("time_display", "")
@@ -2056,18 +2238,18 @@ def render_html_content(
                         .replace("[", "")
                         .replace("]", "")
                     )
-                    html += (
+                    parts.append(
                         f'<span class="time-info">{html_escape(simplified_time)}</span>'
                     )
 
                 # 处理出现次数
                 count_info = title_data.get("count", 1)
                 if count_info > 1:
-                    html += f'<span class="count-info">{count_info}次</span>'
+                    parts.append(f'<span class="count-info">{count_info}次</span>')
 
-                html += """
+                parts.append("""
                             </div>
-                            <div class="news-title">"""
+                            <div class="news-title">""")
 
                 # 处理标题和链接
                 escaped_title = html_escape(title_data["title"])
@@ -2075,58 +2257,44 @@ def render_html_content(
 
                 if link_url:
                     escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                    parts.append(f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>')
                 else:
-                    html += escaped_title
+                    parts.append(escaped_title)
 
-                html += """
+                parts.append("""
                             </div>
                         </div>
-                    </div>"""
+                    </div>""")
 
-            html += """
-                </div>"""
+            parts.append("""
+                </div>""")
 
     # 处理新增新闻区域
     if report_data["new_titles"]:
-        html += f"""
+        parts.append(f"""
                 <div class="new-section">
-                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
+                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>""")
 
         for source_data in report_data["new_titles"]:
             escaped_source = html_escape(source_data["source_name"])
             titles_count = len(source_data["titles"])
 
-            html += f"""
+            parts.append(f"""
                     <div class="new-source-group">
-                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
+                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>""")
 
             # 为新增新闻也添加序号
             for idx, title_data in enumerate(source_data["titles"], 1):
-                ranks = title_data.get("ranks", [])
-
                 # 处理新增新闻的排名显示
-                rank_class = ""
-                if ranks:
-                    min_rank = min(ranks)
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= title_data.get("rank_threshold", 10):
-                        rank_class = "high"
-
-                    if len(ranks) == 1:
-                        rank_text = str(ranks[0])
-                    else:
-                        rank_text = f"{min(ranks)}-{max(ranks)}"
-                else:
-                    rank_text = "?"
+                rank_class = title_data["rank_class"]
+                rank_text = title_data["rank_text"] or "?"
 
-                html += f"""
+                parts.append(f"""
                         <div class="new-item">
                             <div class="new-item-number">{idx}</div>
                             <div class="new-item-rank {rank_class}">{rank_text}</div>
                             <div class="new-item-content">
-                                <div class="new-item-title">"""
+                                <div class="new-item-title">""")
 
                 # 处理新增新闻的链接
                 escaped_title = html_escape(title_data["title"])
@@ -2134,127 +2302,36 @@ def render_html_content(
 
                 if link_url:
                     escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                    parts.append(f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>')
                 else:
-                    html += escaped_title
+                    parts.append(escaped_title)
 
-                html += """
+                parts.append("""
                                 </div>
                             </div>
-                        </div>"""
+                        </div>""")
 
-            html += """
-                    </div>"""
+            parts.append("""
+                    </div>""")
 
-        html += """
-                </div>"""
+        parts.append("""
+                </div>""")
 
-    html += """
-            </div>
-            
-            <div class="footer">
-                <div class="footer-content">
-                    由 <span class="project-name">TrendRadar</span> 生成 · 
-                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
-                        GitHub 开源项目
-                    </a>
-                </div>
-            </div>
-        </div>
-        
-        <script>
-            async function saveAsImage() {
-                const button = document.querySelector('.save-btn');
-                const originalText = button.textContent;
-                
-                try {
-                    button.textContent = '生成中...';
-                    button.disabled = true;
-                    window.scrollTo(0, 0);
-                    
-                    // 等待页面稳定
-                    await new Promise(resolve => setTimeout(resolve, 200));
-                    
-                    // 截图前隐藏按钮
-                    button.style.visibility = 'hidden';
-                    
-                    // 再次等待确保按钮完全隐藏
-                    await new Promise(resolve => setTimeout(resolve, 100));
-                    
-                    const container = document.querySelector('.container');
-                    
-                    // 获取容器的精确位置和尺寸
-                    const rect = container.getBoundingClientRect();
-                    const computedStyle = window.getComputedStyle(container);
-                    
-                    const canvas = await html2canvas(container, {
-                        backgroundColor: '#ffffff',
-                        scale: 1.5,
-                        useCORS: true,
-                        allowTaint: false,
-                        imageTimeout: 10000,
-                        removeContainer: false,
-                        foreignObjectRendering: false,
-                        logging: false,
-                        width: container.offsetWidth,
-                        height: container.offsetHeight,
-                        x: 0,
-                        y: 0,
-                        scrollX: 0,
-                        scrollY: 0,
-                        windowWidth: window.innerWidth,
-                        windowHeight: window.innerHeight
-                    });
-                    
-                    button.style.visibility = 'visible';
-                    
-                    const link = document.createElement('a');
-                    const now = new Date();
-                    const filename = `TrendRadar_热点新闻分析_${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}_${String(now.getHours()).padStart(2, '0')}${String(now.getMinutes()).padStart(2, '0')}.png`;
-                    
-                    link.download = filename;
-                    link.href = canvas.toDataURL('image/png', 1.0);
-                    
-                    // 触发下载
-                    document.body.appendChild(link);
-                    link.click();
-                    document.body.removeChild(link);
-                    
-                    button.textContent = '保存成功!';
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.disabled = false;
-                    }, 2000);
-                    
-                } catch (error) {
-                    button.style.visibility = 'visible';
-                    button.textContent = '保存失败';
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.disabled = false;
-                    }, 2000);
-                }
-            }
-            
-            document.addEventListener('DOMContentLoaded', function() {
-                window.scrollTo(0, 0);
-            });
-        </script>
-    </body>
-    </html>
-    """
+    parts.append(HTML_TAIL)
 
-    return html
+    return parts
 
 
 def render_feishu_content(
     report_data: Dict, update_info: Optional[Dict] = None, mode: str = "daily"
 ) -> str:
     """渲染飞书内容"""
-    text_content = ""
+    parts = []
+    append = parts.append
+    separator = f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
 
     if report_data["stats"]:
-        text_content += f"📊 **热点词汇统计**\n\n"
+        append("📊 **热点词汇统计**\n\n")
 
     total_count = len(report_data["stats"])
 
@@ -2265,94 +2342,99 @@ def render_feishu_content(
         sequence_display = f"<font color='grey'>[{i + 1}/{total_count}]</font>"
 
         if count >= 10:
-            text_content += f"🔥 {sequence_display} **{word}** : <font color='red'>{count}</font> 条\n\n"
+            append(
+                f"🔥 {sequence_display} **{word}** : <font color='red'>{count}</font> 条\n\n"
+            )
         elif count >= 5:
-            text_content += f"📈 {sequence_display} **{word}** : <font color='orange'>{count}</font> 条\n\n"
+            append(
+                f"📈 {sequence_display} **{word}** : <font color='orange'>{count}</font> 条\n\n"
+            )
         else:
-            text_content += f"📌 {sequence_display} **{word}** : {count} 条\n\n"
+            append(f"📌 {sequence_display} **{word}** : {count} 条\n\n")
 
         for j, title_data in enumerate(stat["titles"], 1):
             formatted_title = format_title_for_platform(
                 "feishu", title_data, show_source=True
             )
-            text_content += f"  {j}. {formatted_title}\n"
+            append(f"  {j}. {formatted_title}\n")
 
             if j < len(stat["titles"]):
-                text_content += "\n"
+                append("\n")
 
         if i < len(report_data["stats"]) - 1:
-            text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+            append(separator)
 
-    if not text_content:
+    needs_separator = True
+    if not parts:
         if mode == "incremental":
             mode_text = "增量模式下暂无新增匹配的热点词汇"
         elif mode == "current":
             mode_text = "当前榜单模式下暂无匹配的热点词汇"
         else:
             mode_text = "暂无匹配的热点词汇"
-        text_content = f"📭 {mode_text}\n\n"
+        append(f"📭 {mode_text}\n\n")
+        needs_separator = "暂无匹配" not in mode_text
 
     if report_data["new_titles"]:
-        if text_content and "暂无匹配" not in text_content:
-            text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+        if needs_separator:
+            append(separator)
 
-        text_content += (
-            f"🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
-        )
+        append(f"🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n")
 
         for source_data in report_data["new_titles"]:
-            text_content += (
+            append(
                 f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n"
             )
 
             for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
                 formatted_title = format_title_for_platform(
-                    "feishu", title_data_copy, show_source=False
+                    "feishu", title_data, show_source=False, is_new=False
                 )
-                text_content += f"  {j}. {formatted_title}\n"
+                append(f"  {j}. {formatted_title}\n")
 
-            text_content += "\n"
+            append("\n")
 
     if report_data["failed_ids"]:
-        if text_content and "暂无匹配" not in text_content:
-            text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+        if needs_separator:
+            append(separator)
 
-        text_content += "⚠️ **数据获取失败的平台：**\n\n"
-        for i, id_value in enumerate(report_data["failed_ids"], 1):
-            text_content += f"  • <font color='red'>{id_value}</font>\n"
+        append("⚠️ **数据获取失败的平台：**\n\n")
+        for id_value in report_data["failed_ids"]:
+            append(f"  • <font color='red'>{id_value}</font>\n")
 
     now = get_beijing_time()
-    text_content += (
+    append(
         f"\n\n<font color='grey'>更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}</font>"
     )
 
     if update_info:
-        text_content += f"\n<font color='grey'>TrendRadar 发现新版本 {update_info['remote_version']}，当前 {update_info['current_version']}</font>"
+        append(
+            f"\n<font color='grey'>TrendRadar 发现新版本 {update_info['remote_version']}，当前 {update_info['current_version']}</font>"
+        )
 
-    return text_content
+    return "".join(parts)
 
 
 def render_dingtalk_content(
     report_data: Dict, update_info: Optional[Dict] = None, mode: str = "daily"
 ) -> str:
     """渲染钉钉内容"""
-    text_content = ""
+    parts = []
+    append = parts.append
 
     total_titles = sum(
         len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
     )
     now = get_beijing_time()
 
-    text_content += f"**总新闻数：** {total_titles}\n\n"
-    text_content += f"**时间：** {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    text_content += f"**类型：** 热点分析报告\n\n"
+    append(f"**总新闻数：** {total_titles}\n\n")
+    append(f"**时间：** {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    append("**类型：** 热点分析报告\n\n")
 
-    text_content += "---\n\n"
+    append("---\n\n")
 
     if report_data["stats"]:
-        text_content += f"📊 **热点词汇统计**\n\n"
+        append("📊 **热点词汇统计**\n\n")
 
         total_count = len(report_data["stats"])
 
@@ -2363,24 +2445,25 @@ def render_dingtalk_content(
             sequence_display = f"[{i + 1}/{total_count}]"
 
             if count >= 10:
-                text_content += f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
+                append(f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n")
             elif count >= 5:
-                text_content += f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
+                append(f"📈 {sequence_display} **{word}** : **{count}** 条\n\n")
             else:
-                text_content += f"📌 {sequence_display} **{word}** : {count} 条\n\n"
+                append(f"📌 {sequence_display} **{word}** : {count} 条\n\n")
 
             for j, title_data in enumerate(stat["titles"], 1):
                 formatted_title = format_title_for_platform(
                     "dingtalk", title_data, show_source=True
                 )
-                text_content += f"  {j}. {formatted_title}\n"
+                append(f"  {j}. {formatted_title}\n")
 
                 if j < len(stat["titles"]):
-                    text_content += "\n"
+                    append("\n")
 
             if i < len(report_data["stats"]) - 1:
-                text_content += f"\n---\n\n"
+                append("\n---\n\n")
 
+    needs_separator = True
     if not report_data["stats"]:
         if mode == "incremental":
             mode_text = "增量模式下暂无新增匹配的热点词汇"
@@ -2388,43 +2471,117 @@ def render_dingtalk_content(
             mode_text = "当前榜单模式下暂无匹配的热点词汇"
         else:
             mode_text = "暂无匹配的热点词汇"
-        text_content += f"📭 {mode_text}\n\n"
+        append(f"📭 {mode_text}\n\n")
+        needs_separator = "暂无匹配" not in mode_text
 
     if report_data["new_titles"]:
-        if text_content and "暂无匹配" not in text_content:
-            text_content += f"\n---\n\n"
+        if needs_separator:
+            append("\n---\n\n")
 
-        text_content += (
-            f"🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
-        )
+        append(f"🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n")
 
         for source_data in report_data["new_titles"]:
-            text_content += f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
+            append(
+                f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
+            )
 
             for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
                 formatted_title = format_title_for_platform(
-                    "dingtalk", title_data_copy, show_source=False
+                    "dingtalk", title_data, show_source=False, is_new=False
                 )
-                text_content += f"  {j}. {formatted_title}\n"
+                append(f"  {j}. {formatted_title}\n")
 
-            text_content += "\n"
+            append("\n")
 
     if report_data["failed_ids"]:
-        if text_content and "暂无匹配" not in text_content:
-            text_content += f"\n---\n\n"
+        if needs_separator:
+            append("\n---\n\n")
 
-        text_content += "⚠️ **数据获取失败的平台：**\n\n"
-        for i, id_value in enumerate(report_data["failed_ids"], 1):
-            text_content += f"  • **{id_value}**\n"
+        append("⚠️ **数据获取失败的平台：**\n\n")
+        for id_value in report_data["failed_ids"]:
+            append(f"  • **{id_value}**\n")
 
-    text_content += f"\n\n> 更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}"
+    append(f"\n\n> 更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}")
 
     if update_info:
-        text_content += f"\n> TrendRadar 发现新版本 **{update_info['remote_version']}**，当前 **{update_info['current_version']}**"
+        append(
+            f"\n> TrendRadar 发现新版本 **{update_info['remote_version']}**，当前 **{update_info['current_version']}**"
+        )
 
-    return text_content
+    return "".join(parts)
+
+
+# 分批消息的各部分模板，按推送格式区分
+# word 为词组标题模板，按数量分档：(<5, >=5, >=10)
+BATCH_TEMPLATES = {
+    "wework": {
+        "header": "**总新闻数：** {total}\n\n\n\n",
+        "footer": "\n\n\n> 更新时间：{time}",
+        "version": "\n> TrendRadar 发现新版本 **{remote}**，当前 **{current}**",
+        "stats": "📊 **热点词汇统计**\n\n",
+        "word": (
+            "📌 {seq} **{word}** : {count} 条\n\n",
+            "📈 {seq} **{word}** : **{count}** 条\n\n",
+            "🔥 {seq} **{word}** : **{count}** 条\n\n",
+        ),
+        "separator": "\n\n\n\n",
+        "new": "\n\n\n\n🆕 **本次新增热点新闻** (共 {count} 条)\n\n",
+        "source": "**{name}** ({count} 条):\n\n",
+        "failed": "\n\n\n\n⚠️ **数据获取失败的平台：**\n\n",
+        "failed_line": "  • {id}\n",
+    },
+    "telegram": {
+        "header": "总新闻数： {total}\n\n",
+        "footer": "\n\n更新时间：{time}",
+        "version": "\nTrendRadar 发现新版本 {remote}，当前 {current}",
+        "stats": "📊 热点词汇统计\n\n",
+        "word": (
+            "📌 {seq} {word} : {count} 条\n\n",
+            "📈 {seq} {word} : {count} 条\n\n",
+            "🔥 {seq} {word} : {count} 条\n\n",
+        ),
+        "separator": "\n\n",
+        "new": "\n\n🆕 本次新增热点新闻 (共 {count} 条)\n\n",
+        "source": "{name} ({count} 条):\n\n",
+        "failed": "\n\n⚠️ 数据获取失败的平台：\n\n",
+        "failed_line": "  • {id}\n",
+    },
+    "dingtalk": {
+        "header": (
+            "**总新闻数：** {total}\n\n"
+            "**时间：** {time}\n\n"
+            "**类型：** 热点分析报告\n\n"
+            "---\n\n"
+        ),
+        "footer": "\n\n> 更新时间：{time}",
+        "version": "\n> TrendRadar 发现新版本 **{remote}**，当前 **{current}**",
+        "stats": "📊 **热点词汇统计**\n\n",
+        "word": (
+            "📌 {seq} **{word}** : {count} 条\n\n",
+            "📈 {seq} **{word}** : **{count}** 条\n\n",
+            "🔥 {seq} **{word}** : **{count}** 条\n\n",
+        ),
+        "separator": "\n---\n\n",
+        "new": "\n---\n\n🆕 **本次新增热点新闻** (共 {count} 条)\n\n",
+        "source": "**{name}** ({count} 条):\n\n",
+        "failed": "\n---\n\n⚠️ **数据获取失败的平台：**\n\n",
+        "failed_line": "  • **{id}**\n",
+    },
+}
+
+# 未知格式只输出纯文本内容
+DEFAULT_BATCH_TEMPLATES = {
+    "header": "",
+    "footer": "",
+    "version": "",
+    "stats": "",
+    "word": None,
+    "separator": "",
+    "new": "",
+    "source": "",
+    "failed": "",
+    "failed_line": "  • {id}\n",
+}
 
 
 def split_content_into_batches(
@@ -2447,42 +2604,47 @@ def split_content_into_batches(
         len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
     )
     now = get_beijing_time()
+    now_str = now.strftime("%Y-%m-%d %H:%M:%S")
+    templates = BATCH_TEMPLATES.get(format_type, DEFAULT_BATCH_TEMPLATES)
 
-    base_header = ""
-    if format_type == "wework":
-        base_header = f"**总新闻数：** {total_titles}\n\n\n\n"
-    elif format_type == "telegram":
-        base_header = f"总新闻数： {total_titles}\n\n"
-    elif format_type == "dingtalk":
-        base_header = f"**总新闻数：** {total_titles}\n\n"
-        base_header += f"**时间：** {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        base_header += f"**类型：** 热点分析报告\n\n"
-        base_header += "---\n\n"
-
-    base_footer = ""
-    if format_type == "wework":
-        base_footer = f"\n\n\n> 更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}"
-        if update_info:
-            base_footer += f"\n> TrendRadar 发现新版本 **{update_info['remote_version']}**，当前 **{update_info['current_version']}**"
-    elif format_type == "telegram":
-        base_footer = f"\n\n更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}"
-        if update_info:
-            base_footer += f"\nTrendRadar 发现新版本 {update_info['remote_version']}，当前 {update_info['current_version']}"
-    elif format_type == "dingtalk":
-        base_footer = f"\n\n> 更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}"
-        if update_info:
-            base_footer += f"\n> TrendRadar 发现新版本 **{update_info['remote_version']}**，当前 **{update_info['current_version']}**"
-
-    stats_header = ""
-    if report_data["stats"]:
-        if format_type == "wework":
-            stats_header = f"📊 **热点词汇统计**\n\n"
-        elif format_type == "telegram":
-            stats_header = f"📊 热点词汇统计\n\n"
-        elif format_type == "dingtalk":
-            stats_header = f"📊 **热点词汇统计**\n\n"
-
-    current_batch = base_header
+    base_header = templates["header"].format(total=total_titles, time=now_str)
+
+    base_footer = templates["footer"].format(time=now_str)
+    if update_info and templates["version"]:
+        base_footer += templates["version"].format(
+            remote=update_info["remote_version"],
+            current=update_info["current_version"],
+        )
+
+    stats_header = templates["stats"] if report_data["stats"] else ""
+
+    word_header_templates = templates["word"]
+
+    # 标题格式化方式只取决于 format_type，在循环外确定一次
+    if format_type in ("wework", "telegram", "dingtalk"):
+
+        def format_title(
+            title_data: Dict, show_source: bool, is_new: Optional[bool] = None
+        ) -> str:
+            return format_title_for_platform(
+                format_type, title_data, show_source=show_source, is_new=is_new
+            )
+
+    else:
+
+        def format_title(
+            title_data: Dict, show_source: bool, is_new: Optional[bool] = None
+        ) -> str:
+            return f"{title_data['title']}"
+
+    # 用字节计数器累计当前批次大小，每个片段只编码一次，避免反复编码整个批次
+    base_header_bytes = utf8_len(base_header)
+    base_footer_bytes = utf8_len(base_footer)
+    stats_header_bytes = utf8_len(stats_header)
+
+    # 当前批次以片段列表累积，批次结束时才拼接成字符串
+    current_parts = [base_header]
+    current_bytes = base_header_bytes
     current_batch_has_content = False
 
     if (
@@ -2506,17 +2668,15 @@ def split_content_into_batches(
         total_count = len(report_data["stats"])
 
         # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
+        if current_bytes + stats_header_bytes + base_footer_bytes < max_bytes:
+            current_parts.append(stats_header)
+            current_bytes += stats_header_bytes
             current_batch_has_content = True
         else:
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
+                batches.append("".join(current_parts) + base_footer)
+            current_parts = [base_header, stats_header]
+            current_bytes = base_header_bytes + stats_header_bytes
             current_batch_has_content = True
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
@@ -2525,291 +2685,201 @@ def split_content_into_batches(
             count = stat["count"]
             sequence_display = f"[{i + 1}/{total_count}]"
 
-            # 构建词组标题
+            # 构建词组标题：按数量分档 (<5, >=5, >=10) 选择模板
             word_header = ""
-            if format_type == "wework":
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
-            elif format_type == "telegram":
-                if count >= 10:
-                    word_header = f"🔥 {sequence_display} {word} : {count} 条\n\n"
-                elif count >= 5:
-                    word_header = f"📈 {sequence_display} {word} : {count} 条\n\n"
-                else:
-                    word_header = f"📌 {sequence_display} {word} : {count} 条\n\n"
-            elif format_type == "dingtalk":
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
+            if word_header_templates:
+                tier = (count >= 5) + (count >= 10)
+                word_header = word_header_templates[tier].format(
+                    seq=sequence_display, word=word, count=count
+                )
 
             # 构建第一条新闻
             first_news_line = ""
             if stat["titles"]:
                 first_title_data = stat["titles"][0]
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", first_title_data, show_source=True
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", first_title_data, show_source=True
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", first_title_data, show_source=True
-                    )
-                else:
-                    formatted_title = f"{first_title_data['title']}"
+                formatted_title = format_title(first_title_data, True)
 
                 first_news_line = f"  1. {formatted_title}\n"
                 if len(stat["titles"]) > 1:
                     first_news_line += "\n"
 
             # 原子性检查：词组标题+第一条新闻必须一起处理
+            word_header_bytes = utf8_len(word_header)
             word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
+            word_with_first_news_bytes = word_header_bytes + utf8_len(first_news_line)
 
             if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                current_bytes + word_with_first_news_bytes + base_footer_bytes
                 >= max_bytes
             ):
                 # 当前批次容纳不下，开启新批次
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
+                    batches.append("".join(current_parts) + base_footer)
+                current_parts = [base_header, stats_header, word_with_first_news]
+                current_bytes = (
+                    base_header_bytes + stats_header_bytes + word_with_first_news_bytes
+                )
                 current_batch_has_content = True
                 start_index = 1
             else:
-                current_batch = test_content
+                current_parts.append(word_with_first_news)
+                current_bytes += word_with_first_news_bytes
                 current_batch_has_content = True
                 start_index = 1
 
             # 处理剩余新闻条目
             for j in range(start_index, len(stat["titles"])):
                 title_data = stat["titles"][j]
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data, show_source=True
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data, show_source=True
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data, show_source=True
-                    )
-                else:
-                    formatted_title = f"{title_data['title']}"
+                formatted_title = format_title(title_data, True)
 
                 news_line = f"  {j + 1}. {formatted_title}\n"
                 if j < len(stat["titles"]) - 1:
                     news_line += "\n"
+                news_line_bytes = utf8_len(news_line)
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
+                if current_bytes + news_line_bytes + base_footer_bytes >= max_bytes:
                     if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
+                        batches.append("".join(current_parts) + base_footer)
+                    current_parts = [base_header, stats_header, word_header, news_line]
+                    current_bytes = (
+                        base_header_bytes
+                        + stats_header_bytes
+                        + word_header_bytes
+                        + news_line_bytes
+                    )
                     current_batch_has_content = True
                 else:
-                    current_batch = test_content
+                    current_parts.append(news_line)
+                    current_bytes += news_line_bytes
                     current_batch_has_content = True
 
             # 词组间分隔符
             if i < len(report_data["stats"]) - 1:
-                separator = ""
-                if format_type == "wework":
-                    separator = f"\n\n\n\n"
-                elif format_type == "telegram":
-                    separator = f"\n\n"
-                elif format_type == "dingtalk":
-                    separator = f"\n---\n\n"
-
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
+                separator = templates["separator"]
+
+                separator_bytes = utf8_len(separator)
+                if current_bytes + separator_bytes + base_footer_bytes < max_bytes:
+                    current_parts.append(separator)
+                    current_bytes += separator_bytes
 
     # 处理新增新闻（同样确保来源标题+第一条新闻的原子性）
     if report_data["new_titles"]:
-        new_header = ""
-        if format_type == "wework":
-            new_header = f"\n\n\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
-        elif format_type == "telegram":
-            new_header = (
-                f"\n\n🆕 本次新增热点新闻 (共 {report_data['total_new_count']} 条)\n\n"
-            )
-        elif format_type == "dingtalk":
-            new_header = f"\n---\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
+        new_header = templates["new"].format(count=report_data["total_new_count"])
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
+        new_header_bytes = utf8_len(new_header)
+        if current_bytes + new_header_bytes + base_footer_bytes >= max_bytes:
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
+                batches.append("".join(current_parts) + base_footer)
+            current_parts = [base_header, new_header]
+            current_bytes = base_header_bytes + new_header_bytes
             current_batch_has_content = True
         else:
-            current_batch = test_content
+            current_parts.append(new_header)
+            current_bytes += new_header_bytes
             current_batch_has_content = True
 
         # 逐个处理新增新闻来源
         for source_data in report_data["new_titles"]:
-            source_header = ""
-            if format_type == "wework":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
-            elif format_type == "telegram":
-                source_header = f"{source_data['source_name']} ({len(source_data['titles'])} 条):\n\n"
-            elif format_type == "dingtalk":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
+            source_header = templates["source"].format(
+                name=source_data["source_name"], count=len(source_data["titles"])
+            )
 
             # 构建第一条新增新闻
             first_news_line = ""
             if source_data["titles"]:
                 first_title_data = source_data["titles"][0]
-                title_data_copy = first_title_data.copy()
-                title_data_copy["is_new"] = False
-
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
+                # 新增区域内不再重复显示 🆕 标记
+                formatted_title = format_title(first_title_data, False, False)
 
                 first_news_line = f"  1. {formatted_title}\n"
 
             # 原子性检查：来源标题+第一条新闻
+            source_header_bytes = utf8_len(source_header)
             source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
+            source_with_first_news_bytes = source_header_bytes + utf8_len(
+                first_news_line
+            )
 
             if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                current_bytes + source_with_first_news_bytes + base_footer_bytes
                 >= max_bytes
             ):
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
+                    batches.append("".join(current_parts) + base_footer)
+                current_parts = [base_header, new_header, source_with_first_news]
+                current_bytes = (
+                    base_header_bytes + new_header_bytes + source_with_first_news_bytes
+                )
                 current_batch_has_content = True
                 start_index = 1
             else:
-                current_batch = test_content
+                current_parts.append(source_with_first_news)
+                current_bytes += source_with_first_news_bytes
                 current_batch_has_content = True
                 start_index = 1
 
             # 处理剩余新增新闻
             for j in range(start_index, len(source_data["titles"])):
                 title_data = source_data["titles"][j]
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
-
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
+                formatted_title = format_title(title_data, False, False)
 
                 news_line = f"  {j + 1}. {formatted_title}\n"
+                news_line_bytes = utf8_len(news_line)
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
+                if current_bytes + news_line_bytes + base_footer_bytes >= max_bytes:
                     if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
+                        batches.append("".join(current_parts) + base_footer)
+                    current_parts = [base_header, new_header, source_header, news_line]
+                    current_bytes = (
+                        base_header_bytes
+                        + new_header_bytes
+                        + source_header_bytes
+                        + news_line_bytes
+                    )
                     current_batch_has_content = True
                 else:
-                    current_batch = test_content
+                    current_parts.append(news_line)
+                    current_bytes += news_line_bytes
                     current_batch_has_content = True
 
-            current_batch += "\n"
+            current_parts.append("\n")
+            current_bytes += 1
 
     if report_data["failed_ids"]:
-        failed_header = ""
-        if format_type == "wework":
-            failed_header = f"\n\n\n\n⚠️ **数据获取失败的平台：**\n\n"
-        elif format_type == "telegram":
-            failed_header = f"\n\n⚠️ 数据获取失败的平台：\n\n"
-        elif format_type == "dingtalk":
-            failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
-
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
+        failed_header = templates["failed"]
+
+        failed_header_bytes = utf8_len(failed_header)
+        if current_bytes + failed_header_bytes + base_footer_bytes >= max_bytes:
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
+                batches.append("".join(current_parts) + base_footer)
+            current_parts = [base_header, failed_header]
+            current_bytes = base_header_bytes + failed_header_bytes
             current_batch_has_content = True
         else:
-            current_batch = test_content
+            current_parts.append(failed_header)
+            current_bytes += failed_header_bytes
             current_batch_has_content = True
 
         for i, id_value in enumerate(report_data["failed_ids"], 1):
-            if format_type == "dingtalk":
-                failed_line = f"  • **{id_value}**\n"
-            else:
-                failed_line = f"  • {id_value}\n"
-            
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
+            failed_line = templates["failed_line"].format(id=id_value)
+            failed_line_bytes = utf8_len(failed_line)
+
+            if current_bytes + failed_line_bytes + base_footer_bytes >= max_bytes:
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
+                    batches.append("".join(current_parts) + base_footer)
+                current_parts = [base_header, failed_header, failed_line]
+                current_bytes = (
+                    base_header_bytes + failed_header_bytes + failed_line_bytes
+                )
                 current_batch_has_content = True
             else:
-                current_batch = test_content
+                current_parts.append(failed_line)
+                current_bytes += failed_line_bytes
                 current_batch_has_content = True
 
     # 完成最后批次
     if current_batch_has_content:
-        batches.append(current_batch + base_footer)
+        batches.append("".join(current_parts) + base_footer)
 
     return batches
 
@@ -2826,6 +2896,7 @@ def send_to_webhooks(
 ) -> Dict[str, bool]:
     """发送数据到多个webhook平台"""
     results = {}
+    push_manager = None
 
     if CONFIG["SILENT_PUSH"]["ENABLED"]:
         push_manager = PushRecordManager()
@@ -2854,42 +2925,46 @@ def send_to_webhooks(
 
     update_info_to_send = update_info if CONFIG["SHOW_VERSION_UPDATE"] else None
 
+    # 各平台推送互不依赖，收集后并发发送，总耗时取决于最慢的平台
+    send_tasks = []
+    common_args = (report_data, report_type, update_info_to_send, proxy_url, mode)
+
     # 发送到飞书
     if feishu_url:
-        results["feishu"] = send_to_feishu(
-            feishu_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
+        send_tasks.append(("feishu", send_to_feishu, (feishu_url, *common_args)))
 
     # 发送到钉钉
     if dingtalk_url:
-        results["dingtalk"] = send_to_dingtalk(
-            dingtalk_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
+        send_tasks.append(("dingtalk", send_to_dingtalk, (dingtalk_url, *common_args)))
 
     # 发送到企业微信
     if wework_url:
-        results["wework"] = send_to_wework(
-            wework_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
+        send_tasks.append(("wework", send_to_wework, (wework_url, *common_args)))
 
     # 发送到 Telegram
     if telegram_token and telegram_chat_id:
-        results["telegram"] = send_to_telegram(
-            telegram_token,
-            telegram_chat_id,
-            report_data,
-            report_type,
-            update_info_to_send,
-            proxy_url,
-            mode,
+        send_tasks.append(
+            (
+                "telegram",
+                send_to_telegram,
+                (telegram_token, telegram_chat_id, *common_args),
+            )
         )
 
+    if send_tasks:
+        with ThreadPoolExecutor(max_workers=len(send_tasks)) as executor:
+            futures = [
+                (name, executor.submit(send_func, *args))
+                for name, send_func, args in send_tasks
+            ]
+            for name, future in futures:
+                results[name] = future.result()
+
     if not results:
         print("未配置任何webhook URL，跳过通知发送")
 
     # 如果成功发送了任何通知，且启用了每天只推一次，则记录推送
-    if CONFIG["SILENT_PUSH"]["ENABLED"] and CONFIG["SILENT_PUSH"]["ONCE_PER_DAY"] and any(results.values()):
-        push_manager = PushRecordManager()
+    if push_manager and CONFIG["SILENT_PUSH"]["ONCE_PER_DAY"] and any(results.values()):
         push_manager.record_push(report_type)
         
     return results
@@ -2927,8 +3002,12 @@ def send_to_feishu(
         proxies = {"http": proxy_url, "https": proxy_url}
 
     try:
-        response = requests.post(
-            webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+        response = HTTP_SESSION.post(
+            webhook_url,
+            headers=headers,
+            data=encode_json_payload(payload),
+            proxies=proxies,
+            timeout=30,
         )
         if response.status_code == 200:
             print(f"飞书通知发送成功 [{report_type}]")
@@ -2968,7 +3047,7 @@ def send_to_dingtalk(
 
     # 逐批发送
     for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
+        batch_size = utf8_len(batch_content)
         print(
             f"发送钉钉第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
         )
@@ -2995,8 +3074,12 @@ def send_to_dingtalk(
         }
 
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = HTTP_SESSION.post(
+                webhook_url,
+                headers=headers,
+                data=encode_json_payload(payload),
+                proxies=proxies,
+                timeout=30,
             )
             if response.status_code == 200:
                 result = response.json()
@@ -3044,7 +3127,7 @@ def send_to_wework(
 
     # 逐批发送
     for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
+        batch_size = utf8_len(batch_content)
         print(
             f"发送企业微信第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
         )
@@ -3057,8 +3140,12 @@ def send_to_wework(
         payload = {"msgtype": "markdown", "markdown": {"content": batch_content}}
 
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = HTTP_SESSION.post(
+                webhook_url,
+                headers=headers,
+                data=encode_json_payload(payload),
+                proxies=proxies,
+                timeout=30,
             )
             if response.status_code == 200:
                 result = response.json()
@@ -3111,7 +3198,7 @@ def send_to_telegram(
 
     # 逐批发送
     for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
+        batch_size = utf8_len(batch_content)
         print(
             f"发送Telegram第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
         )
@@ -3129,8 +3216,12 @@ def send_to_telegram(
         }
 
         try:
-            response = requests.post(
-                url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = HTTP_SESSION.post(
+                url,
+                headers=headers,
+                data=encode_json_payload(payload),
+                proxies=proxies,
+                timeout=30,
             )
             if response.status_code == 200:
                 result = response.json()
@@ -3274,12 +3365,10 @@ class NewsAnalyzer:
             # 增量模式和current模式下，只要stats有内容就说明有匹配的新闻
             return any(stat["count"] > 0 for stat in stats)
         else:
-            # 当日汇总模式下，检查是否有匹配的频率词新闻或新增新闻
-            has_matched_news = any(stat["count"] > 0 for stat in stats)
-            has_new_news = bool(
-                new_titles and any(len(titles) > 0 for titles in new_titles.values())
+            # 当日汇总模式下，检查是否有匹配的频率词新闻或新增新闻（命中即短路）
+            return any(stat["count"] > 0 for stat in stats) or bool(
+                new_titles and any(new_titles.values())
             )
-            return has_matched_news or has_new_news
 
     def _load_analysis_data(
         self,
@@ -3293,7 +3382,7 @@ class NewsAnalyzer:
 
             print(f"当前监控平台: {current_platform_ids}")
 
-            all_results, id_to_name, title_info = read_all_today_titles(
+            all_results, id_to_name, title_info, new_titles = read_all_today_titles(
                 current_platform_ids
             )
 
@@ -3304,7 +3393,6 @@ class NewsAnalyzer:
             total_titles = sum(len(titles) for titles in all_results.values())
             print(f"读取到 {total_titles} 个标题（已按当前监控平台过滤）")
 
-            new_titles = detect_latest_new_titles(current_platform_ids)
             word_groups, filter_words = load_frequency_words()
 
             return (